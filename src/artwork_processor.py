@@ -6,11 +6,16 @@ This module contains data processing methods for artwork information.
 Extracted from datacreator.py to improve code organization and maintainability.
 """
 
-import re
 import time
 from datetime import datetime
 from typing import List, Dict, Optional
 
+try:
+    from . import artwork_utils
+except ImportError:
+    # Fallback for when running as standalone module
+    import artwork_utils
+
 
 class ArtworkProcessor:
     """Handles processing and formatting of artwork data."""
@@ -32,9 +37,7 @@ class ArtworkProcessor:
         """
         Clean text from Wikidata responses.
         """
-        if not text:
-            return ""
-        return text.strip().replace('\n', ' ').replace('\r', ' ')
+        return artwork_utils.clean_text(text)
     
     def get_painting_labels(self, wikidata_url: str) -> Dict[str, str]:
         """
@@ -82,27 +85,7 @@ class ArtworkProcessor:
         """
         Convert Wikimedia Commons image URL to a higher resolution version.
         """
-        if not commons_url:
-            return ""
-            
-        # If it's already a thumbnail URL, try to get the original
-        if "/thumb/" in commons_url:
-            # Extract the original filename from thumbnail URL
-            # Format: /thumb/path/to/file.jpg/800px-filename.jpg
-            original_match = re.search(r'/thumb/([^/]+/[^/]+\.(jpg|jpeg|png|gif))', commons_url)
-            if original_match:
-                original_path = original_match.group(1)
-                return f"https://upload.wikimedia.org/wikipedia/commons/{original_path}"
-            else:
-                # If we can't parse it, return the original URL
-                return commons_url
-        
-        # If it's a direct commons URL, return as-is
-        if "commons.wikimedia.org" in commons_url or "upload.wikimedia.org" in commons_url:
-            return commons_url
-            
-        # For other URLs, return as-is
-        return commons_url
+        return artwork_utils.high_res_image_url(commons_url)
     
     def get_wikipedia_summary(self, title: str) -> Optional[str]:
         """
@@ -133,6 +116,17 @@ class ArtworkProcessor:
         """
         processed_paintings = []
         
+        # Fetch inception dates for every usable candidate in one batched query
+        years = {}
+        if wikidata_queries is not None:
+            try:
+                years = wikidata_queries.get_artwork_inception_dates([
+                    item['painting']['value'] for item in raw_data
+                    if item.get('painting', {}).get('value') and item.get('image', {}).get('value')
+                ])
+            except Exception as e:
+                print(f"Error fetching inception dates: {e}")
+        
         for item in raw_data:
             try:
                 # Get Wikidata URL and image first
@@ -155,12 +149,7 @@ class ArtworkProcessor:
                 if image_url:
                     image_url = self.get_high_res_image_url(image_url)
                 
-                # Fetch inception date from Wikidata
-                try:
-                    year = wikidata_queries.get_artwork_inception_date(wikidata_url)
-                except Exception as e:
-                    print(f"Error fetching inception date for {title}: {e}")
-                    year = None
+                year = years.get(wikidata_url)
                 style = "Classical"
                 museum = "Unknown Location"
                 origin = "Unknown"
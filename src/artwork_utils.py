@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Artwork Utilities for Daily Culture Bot
+
+This module contains dependency-free helpers shared by artwork_processor.py
+and the fallbacks in datacreator.py.
+Extracted from artwork_processor.py so both can use a single implementation.
+"""
+
+import re
+from typing import Optional
+
+# Matches the original file path inside a Commons thumbnail URL
+# Format: /thumb/path/to/file.jpg/800px-filename.jpg
+_THUMB_RE = re.compile(r'/thumb/([^/]+/[^/]+\.(jpg|jpeg|png|gif))')
+
+
+def clean_text(text: Optional[str]) -> str:
+    """
+    Clean text from Wikidata responses.
+    """
+    if not text:
+        return ""
+    return text.strip().replace('\n', ' ').replace('\r', ' ')
+
+
+def high_res_image_url(commons_url: str) -> str:
+    """
+    Convert Wikimedia Commons image URL to a higher resolution version.
+    """
+    if not commons_url:
+        return ""
+
+    # If it's already a thumbnail URL, try to get the original
+    if "/thumb/" in commons_url:
+        original_match = _THUMB_RE.search(commons_url)
+        if original_match:
+            original_path = original_match.group(1)
+            return f"https://upload.wikimedia.org/wikipedia/commons/{original_path}"
+        # If we can't parse it, return the original URL
+        return commons_url
+
+    # Direct commons URLs and other URLs are returned as-is
+    return commons_url
@@ -8,6 +8,7 @@ It creates JSON data with detailed painting information for art databases.
 
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import random
 from datetime import datetime
@@ -15,6 +16,7 @@ from typing import List, Dict, Optional, Tuple
 import re
 import concurrent.futures
 from threading import Lock
+from types import MappingProxyType
 
 # Import configuration data
 try:
@@ -26,6 +28,13 @@ except ImportError:
     except ImportError:
         wikidata_config = None
 
+# Dependency-free helpers shared with artwork_processor
+try:
+    from . import artwork_utils
+except ImportError:
+    # Fallback for when running as standalone module
+    import artwork_utils
+
 # Import extracted modules
 try:
     from . import wikidata_queries
@@ -51,31 +60,37 @@ POEM_ANALYZER_AVAILABLE = poem_analyzer is not None
 # Check if vision analyzer is available
 VISION_ANALYZER_AVAILABLE = vision_analyzer is not None
 
+# One pooled session shared by every PaintingDataCreator, so keep-alive
+# connections to Wikidata/Wikipedia/Commons are reused across instances
+_SHARED_SESSION = requests.Session()
+_SHARED_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+_SHARED_SESSION.headers.update({
+    'User-Agent': 'PaintingDataCreator/1.0 (https://github.com/ugurelveren/daily-painting-bot)'
+})
+
 
 class PaintingDataCreator:
+    # Read-only style Q-ID -> name mapping, shared by every instance
+    STYLE_MAPPINGS = MappingProxyType(wikidata_config.STYLE_MAPPINGS if wikidata_config else {})
+    
     def __init__(self, query_timeout: int = 60):
         # Import configuration from separate module
         if wikidata_config:
             self.wikidata_endpoint = wikidata_config.WIKIDATA_ENDPOINT
             self.wikipedia_api = wikidata_config.WIKIPEDIA_API
             self.commons_api = wikidata_config.COMMONS_API
-            self.style_mappings = wikidata_config.STYLE_MAPPINGS
         else:
             # Fallback if module not available
             self.wikidata_endpoint = "https://query.wikidata.org/sparql"
             self.wikipedia_api = "https://en.wikipedia.org/api/rest_v1/page/summary/"
             self.commons_api = "https://commons.wikimedia.org/w/api.php"
-            self.style_mappings = {}
             print("⚠️ Warning: wikidata_config module not available, using fallback configuration")
         
-        # Create a session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'PaintingDataCreator/1.0 (https://github.com/ugurelveren/daily-painting-bot)'
-        })
+        # Reuse the module-level pooled session
+        self.session = _SHARED_SESSION
         
         # Simple query cache to avoid repeated expensive queries
-        self.query_cache = {}
+        self.query_cache = {}  # LRU order: oldest first, shared with self.queries
         self.cache_max_size = 50  # Limit cache size
         self.query_timeout = query_timeout  # Configurable timeout
         
@@ -108,6 +123,11 @@ class PaintingDataCreator:
             self.vision_analyzer = None
             print("⚠️ Warning: vision_analyzer module not available")
 
+    @property
+    def style_mappings(self):
+        """Style Q-ID to style name mapping (read-only, shared across instances)."""
+        return self.STYLE_MAPPINGS
+
     def _is_eligible_for_depicts_bonus(self, q_codes: List[str]) -> bool:
         """
         Check if artwork Q-codes are eligible for depicts bonus.
@@ -192,26 +212,6 @@ class PaintingDataCreator:
         # Only eligible if has concrete objects and no abstract concepts
         return has_concrete and not has_abstract
 
-    def _get_cache_key(self, query_type: str, **params) -> str:
-        """Generate a cache key for query parameters."""
-        # Create a deterministic key from parameters
-        key_parts = [query_type]
-        for k, v in sorted(params.items()):
-            if isinstance(v, list):
-                key_parts.append(f"{k}:{','.join(sorted(v))}")
-            else:
-                key_parts.append(f"{k}:{v}")
-        return "|".join(key_parts)
-
-    def _manage_cache_size(self):
-        """Remove oldest entries if cache is too large."""
-        if len(self.query_cache) > self.cache_max_size:
-            # Remove oldest 25% of entries
-            items_to_remove = len(self.query_cache) // 4
-            oldest_keys = list(self.query_cache.keys())[:items_to_remove]
-            for key in oldest_keys:
-                del self.query_cache[key]
-
     def query_artwork_by_subject(self, q_codes: List[str], limit: int = 50, offset: int = 0, random_order: bool = True, genres: List[str] = None, max_sitelinks: int = 20, artwork_types: List[str] = None) -> List[Dict]:
         """
         Query Wikidata for visual artwork (paintings, photographs, sculptures, etc.) matching specific subjects/themes and genres.
@@ -278,32 +278,6 @@ class PaintingDataCreator:
         
         return None
 
-    def get_high_res_image_url(self, commons_url: str) -> str:
-        """
-        Convert Wikimedia Commons image URL to a higher resolution version.
-        """
-        if not commons_url:
-            return ""
-            
-        # If it's already a thumbnail URL, try to get the original
-        if "/thumb/" in commons_url:
-            # Extract the original filename from thumbnail URL
-            # Format: /thumb/path/to/file.jpg/800px-filename.jpg
-            original_match = re.search(r'/thumb/([^/]+/[^/]+\.(jpg|jpeg|png|gif))', commons_url)
-            if original_match:
-                original_path = original_match.group(1)
-                return f"https://upload.wikimedia.org/wikipedia/commons/{original_path}"
-            else:
-                # If we can't parse it, return the original URL
-                return commons_url
-        
-        # If it's a direct commons URL, return as-is
-        if "commons.wikimedia.org" in commons_url or "upload.wikimedia.org" in commons_url:
-            return commons_url
-            
-        # For other URLs, return as-is
-        return commons_url
-
     def get_artwork_inception_date(self, wikidata_url: str) -> Optional[int]:
         """
         Get artwork inception/creation date from Wikidata URL.
@@ -384,14 +358,6 @@ class PaintingDataCreator:
         
         return "Unknown dimensions"
 
-    def clean_text(self, text: str) -> str:
-        """
-        Clean text from Wikidata responses.
-        """
-        if not text:
-            return ""
-        return text.strip().replace('\n', ' ').replace('\r', ' ')
-
     def get_painting_labels(self, wikidata_url: str) -> Dict[str, str]:
         """
         Get labels for a painting from its Wikidata URL.
@@ -536,31 +502,12 @@ class PaintingDataCreator:
         return {"title": "Unknown Title", "artist": "Unknown Artist"}
     
     def _get_high_res_image_url_fallback(self, commons_url: str) -> str:
-        """Fallback method to get high-res image URL."""
-        if not commons_url:
-            return ""
-            
-        # If it's already a thumbnail URL, try to get the original
-        if "/thumb/" in commons_url:
-            # Extract the original filename from thumbnail URL
-            original_match = re.search(r'/thumb/([^/]+/[^/]+\.(jpg|jpeg|png|gif))', commons_url)
-            if original_match:
-                original_path = original_match.group(1)
-                return f"https://upload.wikimedia.org/wikipedia/commons/{original_path}"
-            else:
-                return commons_url
-        
-        # If it's a direct commons URL, return as-is
-        if "commons.wikimedia.org" in commons_url or "upload.wikimedia.org" in commons_url:
-            return commons_url
-            
-        return commons_url
+        """Fallback method to convert a Commons URL to a higher resolution."""
+        return artwork_utils.high_res_image_url(commons_url)
     
     def _clean_text_fallback(self, text: str) -> str:
         """Fallback method to clean text."""
-        if not text:
-            return ""
-        return text.strip().replace('\n', ' ').replace('\r', ' ')
+        return artwork_utils.clean_text(text)
     
     def get_painting_labels(self, wikidata_url: str) -> Dict[str, str]:
         """Get labels for a painting from its Wikidata URL."""
@@ -1341,7 +1288,7 @@ class PaintingDataCreator:
         """
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(paintings, f, indent=2, ensure_ascii=False)
+                f.write(json.dumps(paintings, indent=2, ensure_ascii=False))
             print(f"Saved {len(paintings)} paintings to {filename}")
         except Exception as e:
             print(f"Error saving to JSON: {e}")
@@ -1371,7 +1318,7 @@ class PaintingDataCreator:
                 
                 # Save back to file
                 with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(all_paintings, f, indent=2, ensure_ascii=False)
+                    f.write(json.dumps(all_paintings, indent=2, ensure_ascii=False))
                 
                 print(f"Added {len(new_paintings)} new paintings to {filename}")
                 print(f"Total paintings in database: {len(all_paintings)}")
@@ -6,9 +6,16 @@ This module contains SPARQL query methods for fetching artwork data from Wikidat
 Extracted from datacreator.py to improve code organization and maintainability.
 """
 
+import re
 import requests
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+# Marks a cache miss, since None/[] are valid cached results
+_CACHE_MISS = object()
+
+# A bare Wikidata entity ID, safe to interpolate into a VALUES clause
+_Q_ID_RE = re.compile(r'Q\d+')
 
 
 class WikidataQueries:
@@ -24,34 +31,37 @@ class WikidataQueries:
             wikidata_endpoint: Wikidata SPARQL endpoint URL
             session: Requests session for HTTP calls
             query_timeout: Timeout for queries in seconds
-            query_cache: Cache dictionary for query results
+            query_cache: LRU cache dictionary for query results, oldest first
             cache_max_size: Maximum cache size
         """
         self.wikidata_endpoint = wikidata_endpoint
         self.session = session
         self.query_timeout = query_timeout
-        self.query_cache = query_cache or {}
+        self.query_cache = query_cache if query_cache is not None else {}
         self.cache_max_size = cache_max_size
     
-    def _get_cache_key(self, query_type: str, **params) -> str:
-        """Generate a cache key for query parameters."""
-        # Create a deterministic key from parameters
-        key_parts = [query_type]
-        for k, v in sorted(params.items()):
-            if isinstance(v, list):
-                key_parts.append(f"{k}:{','.join(sorted(v))}")
-            else:
-                key_parts.append(f"{k}:{v}")
-        return "|".join(key_parts)
+    def _get_cache_key(self, query_type: str, **params) -> Tuple[str, frozenset]:
+        """Generate a hashable cache key for query parameters."""
+        # frozenset makes the key independent of parameter order without sorting;
+        # lists are sorted into tuples so item order doesn't matter either
+        return (query_type, frozenset(
+            (k, tuple(sorted(v)) if isinstance(v, list) else v)
+            for k, v in params.items()
+        ))
+    
+    def _cache_get(self, cache_key: Tuple[str, frozenset]):
+        """Return a cached result and mark it most recently used, or _CACHE_MISS."""
+        value = self.query_cache.pop(cache_key, _CACHE_MISS)
+        if value is not _CACHE_MISS:
+            # Re-inserting moves the key to the end of the dict's insertion order
+            self.query_cache[cache_key] = value
+        return value
     
-    def _manage_cache_size(self):
-        """Remove oldest entries if cache is too large."""
-        if len(self.query_cache) > self.cache_max_size:
-            # Remove oldest 25% of entries
-            items_to_remove = len(self.query_cache) // 4
-            oldest_keys = list(self.query_cache.keys())[:items_to_remove]
-            for key in oldest_keys:
-                del self.query_cache[key]
+    def _cache_put(self, cache_key: Tuple[str, frozenset], value) -> None:
+        """Store a result, evicting least recently used entries beyond cache_max_size."""
+        self.query_cache[cache_key] = value
+        while len(self.query_cache) > self.cache_max_size:
+            self.query_cache.pop(next(iter(self.query_cache)))
     
     def query_artwork_by_subject(self, q_codes: List[str], limit: int = 50, 
                                 offset: int = 0, random_order: bool = True, 
@@ -82,9 +92,10 @@ class WikidataQueries:
                                       q_codes=q_codes, limit=limit, offset=offset, 
                                       max_sitelinks=max_sitelinks, artwork_types=artwork_types)
         
-        if cache_key in self.query_cache:
+        cached = self._cache_get(cache_key)
+        if cached is not _CACHE_MISS:
             print("📋 Using cached query result")
-            return self.query_cache[cache_key]
+            return cached
         
         # Limit Q-codes to prevent overly complex queries
         if len(q_codes) > 10:
@@ -139,8 +150,7 @@ class WikidataQueries:
                 results = data['results']['bindings']
                 
                 # Cache the results
-                self.query_cache[cache_key] = results
-                self._manage_cache_size()
+                self._cache_put(cache_key, results)
                 
                 return results
                 
@@ -182,9 +192,10 @@ class WikidataQueries:
                                       q_codes=q_codes, limit=limit, offset=offset, 
                                       max_sitelinks=max_sitelinks, artwork_types=artwork_types)
         
-        if cache_key in self.query_cache:
+        cached = self._cache_get(cache_key)
+        if cached is not _CACHE_MISS:
             print("📋 Using cached direct depicts query result")
-            return self.query_cache[cache_key]
+            return cached
         
         # Limit Q-codes to prevent overly complex queries
         if len(q_codes) > 8:
@@ -251,8 +262,7 @@ class WikidataQueries:
                 results = data['results']['bindings']
                 
                 # Cache the results
-                self.query_cache[cache_key] = results
-                self._manage_cache_size()
+                self._cache_put(cache_key, results)
                 
                 print(f"🎯 Found {len(results)} artworks with direct depicts matches")
                 return results
@@ -287,9 +297,10 @@ class WikidataQueries:
                                       limit=limit, offset=offset, 
                                       max_sitelinks=max_sitelinks)
         
-        if cache_key in self.query_cache:
+        cached = self._cache_get(cache_key)
+        if cached is not _CACHE_MISS:
             print("📋 Using cached painting query result")
-            return self.query_cache[cache_key]
+            return cached
         
         # Simplified query structure for better performance
         # Remove complex license filtering that causes timeouts
@@ -324,8 +335,7 @@ class WikidataQueries:
                 results = data['results']['bindings']
                 
                 # Cache the results
-                self.query_cache[cache_key] = results
-                self._manage_cache_size()
+                self._cache_put(cache_key, results)
                 
                 return results
                 
@@ -374,7 +384,6 @@ class WikidataQueries:
                     if inception_value:
                         # Parse date string to extract year
                         # Handle various formats: YYYY, YYYY-MM-DD, date ranges
-                        import re
                         year_match = re.match(r'^(\d{4})', inception_value)
                         if year_match:
                             return int(year_match.group(1))
@@ -383,6 +392,57 @@ class WikidataQueries:
         
         return None
     
+    def get_artwork_inception_dates(self, wikidata_urls: List[str],
+                                    batch_size: int = 50) -> Dict[str, Optional[int]]:
+        """
+        Get inception years for several artworks at once.
+        
+        Looks up P571 (inception) for every entity with a single VALUES query
+        per batch instead of one request per artwork. Returns a dictionary
+        mapping each URL to its year, or None if unavailable. URLs that do not
+        end in an entity ID are left as None and never sent to the endpoint.
+        """
+        years = {url: None for url in wikidata_urls if url}
+        urls_by_q_id = {}
+        for url in years:
+            q_id = url.split('/')[-1]
+            if _Q_ID_RE.fullmatch(q_id):
+                urls_by_q_id.setdefault(q_id, []).append(url)
+        
+        q_ids = list(urls_by_q_id)
+        for start in range(0, len(q_ids), batch_size):
+            values = " ".join(f"wd:{q_id}" for q_id in q_ids[start:start + batch_size])
+            sparql_query = f"""
+            SELECT ?painting ?inception WHERE {{
+              VALUES ?painting {{ {values} }}
+              OPTIONAL {{ ?painting wdt:P571 ?inception }}
+            }}
+            """
+            
+            try:
+                response = self.session.get(
+                    self.wikidata_endpoint,
+                    params={'query': sparql_query, 'format': 'json'},
+                    timeout=30
+                )
+                
+                if response.status_code == 200:
+                    data = response.json()
+                    for binding in data['results']['bindings']:
+                        q_id = binding.get('painting', {}).get('value', '').split('/')[-1]
+                        inception_value = binding.get('inception', {}).get('value', '')
+                        year_match = re.match(r'^(\d{4})', inception_value)
+                        if not year_match:
+                            continue
+                        for url in urls_by_q_id.get(q_id, []):
+                            # Keep the first inception value, as the single lookup does
+                            if years[url] is None:
+                                years[url] = int(year_match.group(1))
+            except Exception as e:
+                print(f"Error getting inception dates: {e}")
+        
+        return years
+    
     def get_painting_dimensions(self, wikidata_url: str) -> str:
         """
         Get painting dimensions from Wikidata URL.
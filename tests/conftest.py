@@ -0,0 +1,45 @@
+"""
+Shared pytest fixtures for the Daily Culture Bot test suite.
+"""
+
+import pytest
+import requests
+
+
+@pytest.fixture(autouse=True)
+def no_http(request, monkeypatch):
+    """
+    Fail any test that sends a real HTTP request through ``requests``.
+
+    Tests marked ``network``, ``api`` or ``integration`` are allowed through.
+    Everything else should mock its HTTP calls; an unmocked call fails fast
+    here instead of stalling on DNS or a 30s timeout.
+    """
+    if any(request.node.get_closest_marker(name) for name in ("network", "api", "integration")):
+        return
+
+    def _blocked(self, prepared_request, *args, **kwargs):
+        pytest.fail(f"Unexpected HTTP request in test: {prepared_request.method} {prepared_request.url}")
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", _blocked)
+
+
+@pytest.fixture(scope="session")
+def _painting_creator():
+    """Build one PaintingDataCreator per test session."""
+    from src import datacreator
+    return datacreator.PaintingDataCreator()
+
+
+@pytest.fixture
+def creator(_painting_creator):
+    """
+    Shared PaintingDataCreator with empty query caches.
+
+    The instance is reused across tests, so cached Wikidata results are
+    cleared first to keep one test's responses from leaking into the next.
+    """
+    _painting_creator.query_cache.clear()
+    if _painting_creator.queries is not None:
+        _painting_creator.queries.query_cache.clear()
+    return _painting_creator
@@ -6,13 +6,8 @@ This module contains tests for artwork data processing functionality.
 """
 
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src import artwork_processor
 
 
@@ -386,6 +381,23 @@ class TestProcessPaintingDataEdgeCases:
         # Should return empty list due to exception
         assert result == []
         # Sleep is not called when exception occurs before processing
+    
+    @patch('src.artwork_processor.time.sleep')
+    def test_process_painting_data_without_queries(self, mock_sleep, capsys):
+        """Test that a missing queries module skips the inception lookup quietly."""
+        raw_data = [{
+            'painting': {'value': 'http://www.wikidata.org/entity/Q123'},
+            'image': {'value': 'http://example.com/image.jpg'}
+        }]
+        
+        with patch.object(self.processor, 'get_painting_labels') as mock_labels:
+            mock_labels.return_value = {'title': 'Test Title', 'artist': 'Test Artist'}
+            
+            result = self.processor.process_painting_data(raw_data, None)
+        
+        assert len(result) == 1
+        assert result[0]['year'] is None
+        assert "Error" not in capsys.readouterr().out
 
 
 if __name__ == '__main__':
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tests for Artwork Utilities
+
+This module contains tests for the helpers shared by artwork_processor and datacreator.
+"""
+
+import pytest
+
+from src import artwork_utils
+
+
+@pytest.mark.unit
+class TestCleanText:
+    """Test the shared text cleaning helper."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("  Test Text  ", "Test Text"),
+        ("Line 1\nLine 2\rLine 3", "Line 1 Line 2 Line 3"),
+        ("", ""),
+        (None, ""),
+    ], ids=["normal", "newlines", "empty", "none"])
+    def test_clean_text(self, text, expected):
+        """Test cleaning surrounding whitespace, line breaks and empty values."""
+        assert artwork_utils.clean_text(text) == expected
+
+
+@pytest.mark.unit
+class TestHighResImageUrl:
+    """Test the shared Commons high-resolution URL helper."""
+
+    @pytest.mark.parametrize("url, expected", [
+        ("https://upload.wikimedia.org/wikipedia/commons/thumb/ab/Test.png/800px-Test.png",
+         "https://upload.wikimedia.org/wikipedia/commons/ab/Test.png"),
+        ("https://upload.wikimedia.org/wikipedia/commons/thumb/ab/Test.svg/800px-Test.svg.png",
+         "https://upload.wikimedia.org/wikipedia/commons/thumb/ab/Test.svg/800px-Test.svg.png"),
+        ("https://upload.wikimedia.org/wikipedia/commons/ab/Test.jpg",
+         "https://upload.wikimedia.org/wikipedia/commons/ab/Test.jpg"),
+        ("https://example.com/image.jpg", "https://example.com/image.jpg"),
+        ("", ""),
+        (None, ""),
+    ], ids=["thumbnail", "unparseable_thumbnail", "original", "other_host", "empty", "none"])
+    def test_high_res_image_url(self, url, expected):
+        """Test that thumbnails are rewritten and other URLs pass through."""
+        assert artwork_utils.high_res_image_url(url) == expected
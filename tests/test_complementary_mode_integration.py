@@ -8,12 +8,8 @@ and match explanations with real API calls.
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-import sys
 import os
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 
 class TestComplementaryModeIntegration:
     """Test full complementary mode workflow."""
@@ -7,11 +7,6 @@ Tests the spaCy-based concrete noun extraction functionality.
 
 import pytest
 from unittest.mock import Mock, patch
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import concrete_element_extractor
 from concrete_element_extractor import ConcreteElementExtractor
@@ -1,17 +1,27 @@
 import pytest
-import json
 import os
-import sys
 from datetime import date
-from unittest.mock import Mock, patch, mock_open, MagicMock
+from unittest.mock import Mock, patch, MagicMock, mock_open
 import requests
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src import daily_paintings
 
 
+class CountingFn:
+    """Minimal callable stub that only records how many times it was called."""
+
+    __slots__ = ('calls', '_rv')
+
+    def __init__(self, rv=None):
+        self.calls = 0
+        self._rv = rv
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self._rv
+
+
+@pytest.mark.xdist_group(name="TestArgumentParsing")
 class TestArgumentParsing:
     """Test command line argument parsing."""
     
@@ -133,6 +143,7 @@ class TestArgumentParsing:
                 assert args.email == email
 
 
+@pytest.mark.xdist_group(name="TestDownloadImage")
 class TestDownloadImage:
     """Test image download functionality."""
     
@@ -216,10 +227,11 @@ class TestDownloadImage:
 
 
 
+@pytest.mark.xdist_group(name="TestComplementaryMode")
 class TestComplementaryMode:
     """Test complementary mode functionality."""
     
-    @patch('daily_paintings.download_image')
+    @patch('src.daily_paintings.download_image')
     @patch('src.datacreator.PaintingDataCreator')
     @patch('src.poem_fetcher.PoemFetcher')
     @patch('src.poem_analyzer.PoemAnalyzer')
@@ -239,23 +251,23 @@ class TestComplementaryMode:
             {"title": "Nature Poem", "text": "flowers and trees", "author": "Test Author", 
              "line_count": 10, "source": "Test Source"}
         ]
-        mock_poem_fetcher.create_sample_poems.return_value = [
+        mock_poem_fetcher.create_sample_poems = CountingFn([
             {"title": "Nature Poem", "text": "flowers and trees", "author": "Test Author",
              "line_count": 10, "source": "Test Source"}
-        ]
+        ])
         
         # Mock poem analysis
-        mock_analyzer.analyze_multiple_poems.return_value = [
+        mock_analyzer.analyze_multiple_poems = CountingFn([
             {"themes": ["nature", "flowers"], "q_codes": ["Q7860", "Q506"], "has_themes": True, "emotions": [], "primary_emotions": [], "secondary_emotions": []}
-        ]
+        ])
         mock_analyzer.get_combined_q_codes.return_value = ["Q7860", "Q506"]
         mock_analyzer.get_emotion_q_codes.return_value = []
         
         # Mock artwork data - fast mode uses create_sample_paintings
-        mock_creator.create_sample_paintings.return_value = [
+        mock_creator.create_sample_paintings = CountingFn([
             {"title": "Flower Painting", "artist": "Test Artist", "image": "test.jpg", "year": "2020",
              "style": "Modern", "medium": "Oil", "museum": "Test Museum", "origin": "Test Country"}
-        ]
+        ])
         
         mock_download.return_value = './test.jpg'
         
@@ -264,9 +276,9 @@ class TestComplementaryMode:
                 daily_paintings.main()
         
         # Verify complementary mode was used
-        mock_poem_fetcher.create_sample_poems.assert_called_once()
-        mock_analyzer.analyze_multiple_poems.assert_called_once()
-        mock_creator.create_sample_paintings.assert_called_once()
+        assert mock_poem_fetcher.create_sample_poems.calls == 1
+        assert mock_analyzer.analyze_multiple_poems.calls == 1
+        assert mock_creator.create_sample_paintings.calls == 1
     
     @patch('src.datacreator.PaintingDataCreator')
     @patch('src.poem_fetcher.PoemFetcher')
@@ -287,30 +299,30 @@ class TestComplementaryMode:
             {"title": "Nature Poem", "text": "flowers and trees", "author": "Test Author", 
              "line_count": 10, "source": "Test Source"}
         ]
-        mock_poem_fetcher.create_sample_poems.return_value = [
+        mock_poem_fetcher.create_sample_poems = CountingFn([
             {"title": "Nature Poem", "text": "flowers and trees", "author": "Test Author",
              "line_count": 10, "source": "Test Source"}
-        ]
+        ])
         
         # Mock poem analysis
-        mock_analyzer.analyze_multiple_poems.return_value = [
+        mock_analyzer.analyze_multiple_poems = CountingFn([
             {"themes": ["nature", "flowers"], "q_codes": ["Q7860", "Q506"], "has_themes": True, "emotions": [], "primary_emotions": [], "secondary_emotions": []}
-        ]
+        ])
         mock_analyzer.get_combined_q_codes.return_value = ["Q7860", "Q506"]
         mock_analyzer.get_emotion_q_codes.return_value = []
         
         # Mock no matching artwork found - fast mode uses create_sample_paintings
-        mock_creator.create_sample_paintings.return_value = [
+        mock_creator.create_sample_paintings = CountingFn([
             {"title": "Random Painting", "artist": "Test Artist", "image": "test.jpg", "year": "2020",
              "style": "Classical", "medium": "Oil", "museum": "Test Museum", "origin": "Test Country"}
-        ]
+        ])
         
         with patch('sys.argv', ['daily_paintings.py', '--complementary', '--fast']):
             with patch('builtins.open', mock_open()):
                 daily_paintings.main()
         
         # Verify fallback was used
-        mock_creator.create_sample_paintings.assert_called_once()
+        assert mock_creator.create_sample_paintings.calls == 1
     
     def test_complementary_poems_only_error(self):
         """Test that complementary and poems-only flags cannot be used together."""
@@ -321,10 +333,11 @@ class TestComplementaryMode:
                 mock_print.assert_any_call("❌ Error: --complementary and --poems-only cannot be used together")
 
 
+@pytest.mark.xdist_group(name="TestMain")
 class TestMain:
     """Test main function integration."""
     
-    @patch('daily_paintings.download_image')
+    @patch('src.daily_paintings.download_image')
     @patch('src.datacreator.PaintingDataCreator')
     def test_main_fast_mode(self, mock_creator_class, mock_download):
         """Test main function with fast mode."""
@@ -352,7 +365,7 @@ class TestMain:
         
         mock_creator.create_sample_paintings.assert_called_once_with(1)
     
-    @patch('daily_paintings.download_image')
+    @patch('src.daily_paintings.download_image')
     @patch('src.datacreator.PaintingDataCreator')
     def test_main_with_output_flag(self, mock_creator_class, mock_download):
         """Test main function with --output flag."""
@@ -391,7 +404,7 @@ class TestMain:
                 daily_paintings.main()
     
     @patch('src.email_sender.EmailSender')
-    @patch('daily_paintings.download_image')
+    @patch('src.daily_paintings.download_image')
     @patch('src.datacreator.PaintingDataCreator')
     def test_main_with_email_flag(self, mock_creator_class, mock_download, mock_email_sender_class):
         """Test main function with --email flag."""
@@ -430,7 +443,7 @@ class TestMain:
         mock_email_sender.send_email.assert_called_once()
     
     @patch('src.email_sender.EmailSender')
-    @patch('daily_paintings.download_image')
+    @patch('src.daily_paintings.download_image')
     @patch('src.datacreator.PaintingDataCreator')
     def test_main_with_email_html_format(self, mock_creator_class, mock_download, mock_email_sender_class):
         """Test main function with --email and --email-format html."""
@@ -508,8 +521,9 @@ class TestMain:
         mock_email_sender.send_email.assert_called_once()
     
     @patch('src.email_sender.EmailSender')
+    @patch('src.daily_paintings.download_image', return_value='./test.jpg')
     @patch('src.datacreator.PaintingDataCreator')
-    def test_main_with_email_failure(self, mock_creator_class, mock_email_sender_class):
+    def test_main_with_email_failure(self, mock_creator_class, mock_download, mock_email_sender_class):
         """Test main function with email sending failure."""
         # Setup mocks
         mock_creator = Mock()
@@ -575,27 +589,10 @@ class TestMain:
         mock_email_sender_class.assert_called_once()
 
 
+@pytest.mark.xdist_group(name="TestFileOperations")
 class TestFileOperations:
     """Test file operations and JSON handling."""
     
-    @patch('builtins.open', new_callable=mock_open)
-    def test_save_json_output(self, mock_file):
-        """Test saving JSON output."""
-        paintings = [
-            {
-                'title': 'Test Painting',
-                'artist': 'Test Artist',
-                'year': '2020'
-            }
-        ]
-        
-        # Simulate the JSON saving logic
-        with patch('builtins.open', mock_open()) as m:
-            json.dump(paintings, m(), indent=2, ensure_ascii=False)
-        
-        # Verify file was opened for writing
-        assert True  # File operation completed successfully
-    
     def test_image_filename_generation(self):
         """Test that image filenames are generated correctly."""
         painting = {
@@ -617,6 +614,7 @@ class TestFileOperations:
         assert filename2 == 'Painting 1_2020.png'
 
 
+@pytest.mark.xdist_group(name="TestDailyPaintingsCoverage")
 class TestDailyPaintingsCoverage:
     """Additional tests to improve coverage for daily_paintings.py."""
     
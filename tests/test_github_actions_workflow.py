@@ -7,13 +7,9 @@ Tests that simulate the GitHub Actions environment and validate CI/CD workflow b
 
 import pytest
 import os
-import sys
 import subprocess
 from unittest.mock import Mock, patch, MagicMock, mock_open
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 
 class TestGitHubActionsEnvironment:
     """Test GitHub Actions environment simulation."""
@@ -7,13 +7,8 @@ for the birthday poem test case from the console output.
 """
 
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src import poem_analyzer, match_explainer, datacreator
 
 
@@ -8,13 +8,9 @@ and component integration to prevent issues like the OpenAI client initializatio
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-import sys
 import os
 import json
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 
 class TestOpenAIClientPassing:
     """Test that OpenAI client is properly passed between components."""
@@ -7,11 +7,6 @@ Tests the match explanation generation functionality.
 
 import pytest
 from unittest.mock import Mock
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import match_explainer
 from match_explainer import MatchExplainer
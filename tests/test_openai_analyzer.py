@@ -7,13 +7,9 @@ Tests the select_best_artwork_matches method for AI-driven artwork selection.
 
 import pytest
 from unittest.mock import Mock, patch
-import sys
 import os
 import json
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 import openai_analyzer
 from openai_analyzer import OpenAIAnalyzer
 
@@ -4,14 +4,9 @@ Tests for PoemFetcher class
 """
 
 import pytest
-import sys
-import os
 import requests
 from unittest.mock import Mock, patch
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.poem_fetcher import PoemFetcher
 
 
@@ -779,7 +774,7 @@ class TestPoemFetcherCoverage:
     
     def test_timeout_handling(self):
         """Test timeout handling in poem fetching."""
-        with patch('requests.get') as mock_get:
+        with patch.object(self.fetcher.session, 'get') as mock_get:
             mock_get.side_effect = requests.Timeout("Request timeout")
             
             # Should handle timeouts gracefully
@@ -792,7 +787,7 @@ class TestPoemFetcherCoverage:
     
     def test_retry_logic(self):
         """Test retry logic for failed requests."""
-        with patch('requests.get') as mock_get:
+        with patch.object(self.fetcher.session, 'get') as mock_get:
             # First call fails, second succeeds
             mock_get.side_effect = [
                 requests.ConnectionError("Connection error"),
@@ -809,7 +804,7 @@ class TestPoemFetcherCoverage:
     
     def test_network_error_handling(self):
         """Test network error handling."""
-        with patch('requests.get') as mock_get:
+        with patch.object(self.fetcher.session, 'get') as mock_get:
             mock_get.side_effect = requests.ConnectionError("Network error")
             
             # Should handle network errors gracefully
@@ -822,7 +817,7 @@ class TestPoemFetcherCoverage:
     
     def test_invalid_response_handling(self):
         """Test handling of invalid API responses."""
-        with patch('requests.get') as mock_get:
+        with patch.object(self.fetcher.session, 'get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.side_effect = ValueError("Invalid JSON")
@@ -845,7 +840,7 @@ class TestPoemFetcherCoverage:
     @pytest.mark.api
     def test_malformed_poem_data(self):
         """Test handling of malformed poem data."""
-        with patch('requests.get') as mock_get:
+        with patch.object(self.fetcher.session, 'get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -962,7 +957,7 @@ class TestPoemFetcherCoverage:
         ]
         
         for error in error_conditions:
-            with patch('requests.get') as mock_get:
+            with patch.object(self.fetcher.session, 'get') as mock_get:
                 mock_get.side_effect = error
                 
                 # Should recover gracefully
@@ -7,13 +7,9 @@ Tests using real captured data to verify system behavior with actual data struct
 
 import pytest
 import json
-import sys
 import os
 from unittest.mock import Mock, patch
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 
 class TestRealDataScenarios:
     """Test scenarios using real captured data."""
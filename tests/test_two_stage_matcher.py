@@ -7,11 +7,6 @@ Tests the two-stage matching process with hard constraints and weighted scoring.
 
 import pytest
 from unittest.mock import Mock
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import two_stage_matcher
 from two_stage_matcher import TwoStageMatcher
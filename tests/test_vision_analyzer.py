@@ -7,12 +7,8 @@ Tests the GPT-4 Vision integration for artwork image analysis.
 
 import pytest
 from unittest.mock import Mock, patch
-import sys
 import os
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 import vision_analyzer
 from vision_analyzer import VisionAnalyzer
 
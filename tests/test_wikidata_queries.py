@@ -1,11 +1,7 @@
 import pytest
-import sys
-import os
 import requests
 from unittest.mock import Mock, patch, MagicMock
-
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hypothesis import given, strategies as st
 
 from src import wikidata_queries
 
@@ -46,24 +42,33 @@ class TestGetCacheKey:
         """Test cache key generation with simple parameters."""
         key = self.queries._get_cache_key("test_query", limit=10, offset=0)
         
-        assert key == "test_query|limit:10|offset:0"
+        assert key == ("test_query", frozenset({("limit", 10), ("offset", 0)}))
     
     def test_get_cache_key_with_list(self):
         """Test cache key generation with list parameters."""
-        key = self.queries._get_cache_key("test_query", q_codes=["Q1", "Q2"], limit=10)
+        key = self.queries._get_cache_key("test_query", q_codes=["Q2", "Q1"], limit=10)
         
-        assert key == "test_query|limit:10|q_codes:Q1,Q2"
+        assert key == ("test_query", frozenset({("limit", 10), ("q_codes", ("Q1", "Q2"))}))
     
-    def test_get_cache_key_sorted(self):
-        """Test cache key generation with parameters in different order."""
-        key1 = self.queries._get_cache_key("test_query", limit=10, offset=0)
-        key2 = self.queries._get_cache_key("test_query", offset=0, limit=10)
+    @given(params=st.dictionaries(
+        keys=st.from_regex(r"[a-z_][a-z0-9_]{0,10}", fullmatch=True).filter(lambda k: k != "query_type"),
+        values=st.one_of(st.integers(), st.text(), st.lists(st.text(), max_size=4)),
+        max_size=5,
+    ))
+    def test_get_cache_key_sorted(self, params):
+        """Test that cache keys ignore parameter and list-item order."""
+        reordered = {
+            k: list(reversed(v)) if isinstance(v, list) else v
+            for k, v in reversed(list(params.items()))
+        }
         
-        assert key1 == key2  # Should be the same regardless of order
+        # Keys should be the same regardless of parameter order
+        assert self.queries._get_cache_key("test_query", **params) == \
+            self.queries._get_cache_key("test_query", **reordered)
 
 
-class TestManageCacheSize:
-    """Test _manage_cache_size method."""
+class TestCachePut:
+    """Test LRU eviction in _cache_put and _cache_get."""
     
     def setup_method(self):
         """Set up test fixtures."""
@@ -75,48 +80,56 @@ class TestManageCacheSize:
             cache_max_size=3
         )
     
-    def test_manage_cache_size_below_limit(self):
-        """Test cache management when under limit."""
-        self.queries.query_cache = {"key1": "value1", "key2": "value2"}
-        
-        self.queries._manage_cache_size()
+    def _put(self, *keys):
+        for key in keys:
+            self.queries._cache_put(key, f"value_{key}")
+    
+    @pytest.mark.parametrize("keys, expected", [
+        (["key1", "key2"], ["key1", "key2"]),
+        (["key1", "key2", "key3"], ["key1", "key2", "key3"]),
+        (["key1", "key2", "key3", "key4"], ["key2", "key3", "key4"]),
+        ([], []),
+    ], ids=["below_limit", "at_exact_limit", "above_limit", "empty"])
+    def test_cache_put_size(self, keys, expected):
+        """Test that each put leaves at most cache_max_size newest entries."""
+        self._put(*keys)
         
-        assert len(self.queries.query_cache) == 2
-        assert "key1" in self.queries.query_cache
-        assert "key2" in self.queries.query_cache
+        assert list(self.queries.query_cache) == expected
     
-    def test_manage_cache_size_at_exact_limit(self):
-        """Test cache management when at exact limit."""
-        self.queries.query_cache = {"key1": "value1", "key2": "value2", "key3": "value3"}
+    def test_cache_put_evicts_one_per_put(self):
+        """Test that each put past the limit evicts exactly the oldest entry."""
+        class PopCountingDict(dict):
+            pops = 0
+            
+            def pop(self, *args):
+                self.pops += 1
+                return super().pop(*args)
         
-        self.queries._manage_cache_size()
+        self.queries.query_cache = PopCountingDict()
+        self._put(*(f"key{i}" for i in range(1000)))
         
-        assert len(self.queries.query_cache) == 3
-        assert "key1" in self.queries.query_cache
-        assert "key2" in self.queries.query_cache
-        assert "key3" in self.queries.query_cache
+        assert self.queries.query_cache.pops == 1000 - 3
+        assert list(self.queries.query_cache) == ["key997", "key998", "key999"]
     
-    def test_manage_cache_size_above_limit(self):
-        """Test cache management when over limit."""
-        self.queries.query_cache = {
-            "key1": "value1", 
-            "key2": "value2", 
-            "key3": "value3",
-            "key4": "value4"
-        }
+    def test_cache_get_refreshes_recency(self):
+        """Test that a hit moves the entry behind newer ones."""
+        self._put("key1", "key2", "key3")
         
-        self.queries._manage_cache_size()
+        assert self.queries._cache_get("key1") == "value_key1"
+        self._put("key4")
         
-        assert len(self.queries.query_cache) <= 3
-        # Should evict oldest entries
+        assert list(self.queries.query_cache) == ["key3", "key1", "key4"]
     
-    def test_manage_cache_size_empty_cache(self):
-        """Test cache management with empty cache."""
-        self.queries.query_cache = {}
-        
-        self.queries._manage_cache_size()
+    def test_cache_get_miss(self):
+        """Test that a miss returns the sentinel and stores nothing."""
+        assert self.queries._cache_get("absent") is wikidata_queries._CACHE_MISS
+        assert self.queries.query_cache == {}
+    
+    def test_cache_get_falsy_value(self):
+        """Test that cached empty results count as hits."""
+        self.queries._cache_put("empty", [])
         
-        assert len(self.queries.query_cache) == 0
+        assert self.queries._cache_get("empty") == []
 
 
 class TestQueryRetryLogic:
@@ -233,6 +246,30 @@ class TestCacheHitMiss:
             assert mock_get.call_count == 0
     
     
+    def test_cache_hit_refreshes_recency(self):
+        """Test that a cache hit protects the entry from the next eviction."""
+        self.queries.cache_max_size = 2
+        self.queries.query_cache.update([("a", ["A"]), ("b", ["B"])])
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'results': {'bindings': [{'test': {'value': 'x'}}]}}
+        
+        with patch.object(self.queries, '_get_cache_key', side_effect=["a", "c"]), \
+             patch.object(self.queries.session, 'get', return_value=mock_response):
+            assert self.queries.query_artwork_by_subject(["Q1"], limit=1) == ["A"]
+            self.queries.query_artwork_by_subject(["Q2"], limit=1)
+        
+        assert list(self.queries.query_cache) == ["a", "c"]
+    
+    def test_shares_cache(self):
+        """Test that the cache passed in is shared rather than copied, even when empty."""
+        cache = {}
+        queries = wikidata_queries.WikidataQueries(
+            "https://query.wikidata.org/sparql", Mock(), query_cache=cache
+        )
+        
+        assert queries.query_cache is cache
+    
     def test_cache_miss_fetches_new_data(self):
         """Test cache miss fetches new data."""
         mock_response = Mock()
@@ -419,5 +456,94 @@ class TestQCodesLimiting:
             assert "Q11" not in query_text
 
 
+class TestGetArtworkInceptionDates:
+    """Test batched get_artwork_inception_dates lookups."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.queries = wikidata_queries.WikidataQueries(
+            "https://query.wikidata.org/sparql",
+            Mock(),
+            query_timeout=60
+        )
+    
+    @pytest.mark.parametrize("bindings, expected", [
+        ([{'painting': {'value': 'http://www.wikidata.org/entity/Q1'},
+           'inception': {'value': '1831-01-01T00:00:00Z'}},
+          {'painting': {'value': 'http://www.wikidata.org/entity/Q2'},
+           'inception': {'value': '1503-01-01T00:00:00Z'}}],
+         {'Q1': 1831, 'Q2': 1503}),
+        ([{'painting': {'value': 'http://www.wikidata.org/entity/Q1'},
+           'inception': {'value': '1503-01-01T00:00:00Z'}},
+          {'painting': {'value': 'http://www.wikidata.org/entity/Q1'},
+           'inception': {'value': '1519-01-01T00:00:00Z'}}],
+         {'Q1': 1503, 'Q2': None}),
+        ([{'painting': {'value': 'http://www.wikidata.org/entity/Q1'}},
+          {'painting': {'value': 'http://www.wikidata.org/entity/Q2'},
+           'inception': {'value': 't329112'}}],
+         {'Q1': None, 'Q2': None}),
+    ], ids=["all_dated", "first_value_wins", "missing_and_unknown"])
+    def test_get_artwork_inception_dates(self, bindings, expected):
+        """Test that one VALUES query resolves the year for every URL."""
+        urls = [f"https://www.wikidata.org/wiki/{q_id}" for q_id in expected]
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'results': {'bindings': bindings}}
+        
+        with patch.object(self.queries.session, 'get', return_value=mock_response) as mock_get:
+            result = self.queries.get_artwork_inception_dates(urls)
+        
+        assert result == {f"https://www.wikidata.org/wiki/{q_id}": year
+                          for q_id, year in expected.items()}
+        mock_get.assert_called_once()
+        query_text = mock_get.call_args[1]['params']['query']
+        assert "VALUES ?painting { wd:Q1 wd:Q2 }" in query_text
+    
+    def test_get_artwork_inception_dates_batches(self):
+        """Test that large URL lists are split into batch_size chunks."""
+        urls = [f"https://www.wikidata.org/wiki/Q{i}" for i in range(5)]
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'results': {'bindings': []}}
+        
+        with patch.object(self.queries.session, 'get', return_value=mock_response) as mock_get:
+            result = self.queries.get_artwork_inception_dates(urls, batch_size=2)
+        
+        assert mock_get.call_count == 3
+        assert result == dict.fromkeys(urls)
+    
+    @pytest.mark.parametrize("bad_url", [
+        "https://www.wikidata.org/wiki/Q2/",
+        "https://www.wikidata.org/wiki/Q2 } ?x ?y {",
+        "https://www.wikidata.org/wiki/Special:Search",
+    ], ids=["trailing_slash", "injection", "not_an_entity"])
+    def test_get_artwork_inception_dates_skips_bad_ids(self, bad_url):
+        """Test that URLs without a bare Q-ID stay None and stay out of the query."""
+        urls = ["https://www.wikidata.org/wiki/Q1", bad_url, "https://www.wikidata.org/wiki/Q3"]
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'results': {'bindings': [
+            {'painting': {'value': 'http://www.wikidata.org/entity/Q1'},
+             'inception': {'value': '1889-01-01T00:00:00Z'}},
+        ]}}
+        
+        with patch.object(self.queries.session, 'get', return_value=mock_response) as mock_get:
+            result = self.queries.get_artwork_inception_dates(urls)
+        
+        assert result == {urls[0]: 1889, bad_url: None, urls[2]: None}
+        query_text = mock_get.call_args[1]['params']['query']
+        assert "VALUES ?painting { wd:Q1 wd:Q3 }" in query_text
+    
+    def test_get_artwork_inception_dates_error(self):
+        """Test that request errors leave every year as None."""
+        urls = ["https://www.wikidata.org/wiki/Q1", ""]
+        
+        with patch.object(self.queries.session, 'get',
+                          side_effect=requests.RequestException("boom")):
+            result = self.queries.get_artwork_inception_dates(urls)
+        
+        assert result == {"https://www.wikidata.org/wiki/Q1": None}
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -7,16 +7,12 @@ Tests workflow configuration validation and parameter consistency.
 
 import pytest
 import os
-import sys
 try:
     import yaml
 except ImportError:
     yaml = None
 from unittest.mock import Mock, patch, mock_open
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 
 class TestWorkflowConfiguration:
     """Test workflow configuration validation."""